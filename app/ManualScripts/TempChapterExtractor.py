@@ -1,36 +1,76 @@
 import os
 import re
-import json
+import asyncio
 import datetime
-import requests
-from typing import List, Dict, Any, Optional, Tuple
+import functools
+import httpx
+import orjson
+from typing import AsyncIterator, List, Dict, Any, Optional, Tuple
 from dotenv import load_dotenv
 
 load_dotenv()
 YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY")  # set this env var
 PLAYLIST_ID = "PLDqahtm2vA70VohJ__IobJSOGFJ2SdaRO"
 
-# Matches "0:00 Title" or "12:34 Title" or "1:02:03 Title" at start of a line
-CHAPTER_LINE_RE = re.compile(r"^(?P<ts>(?:\d+:)?\d{1,2}:\d{2})\s*[-–—]\s*(?P<title>.+)$|^(?P<ts2>(?:\d+:)?\d{1,2}:\d{2})\s+(?P<title2>.+)$")
+# Sort key for videos with a missing/malformed publishedAt (sorts last)
+_DT_MIN = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
+
+# Matches "0:00 - Title" / "12:34 – Title" (dash form, tried first) or "1:02:03 Title" at start of a line
+_RE_DASH = re.compile(r"^((?:\d+:)?\d{1,2}:\d{2})\s*[-–—]\s*(.+)$")
+_RE_SPACE = re.compile(r"^((?:\d+:)?\d{1,2}:\d{2})\s+(.+)$")
 
 def parse_timestamp_to_seconds(ts: str) -> int:
-    parts = ts.split(":")
-    parts = [int(p) for p in parts]
-    if len(parts) == 2:
-        m, s = parts
-        return m * 60 + s
-    if len(parts) == 3:
-        h, m, s = parts
-        return h * 3600 + m * 60 + s
-    raise ValueError(f"Unrecognized timestamp format: {ts}")
-
-def yt_get(url: str, params: Dict[str, Any]) -> Dict[str, Any]:
-    r = requests.get(url, params=params, timeout=30)
-    r.raise_for_status()
-    return r.json()
-
-def fetch_all_playlist_video_ids(playlist_id: str) -> List[str]:
-    video_ids = []
+    # Single pass over "M:SS" / "H:MM:SS" (no split/list/int() allocations)
+    total = 0
+    seg = 0
+    colons = 0
+    for ch in ts:
+        if ch == ":":
+            total = total * 60 + seg
+            seg = 0
+            colons += 1
+        elif "0" <= ch <= "9":
+            seg = seg * 10 + (ord(ch) - 48)
+        else:
+            raise ValueError(f"Unrecognized timestamp format: {ts}")
+    if colons not in (1, 2):
+        raise ValueError(f"Unrecognized timestamp format: {ts}")
+    return total * 60 + seg
+
+@functools.lru_cache(maxsize=4096)
+def _parse_yt_date(s: str) -> datetime.datetime:
+    # YouTube always returns publishedAt as "YYYY-MM-DDTHH:MM:SSZ"; slice it directly
+    if len(s) == 20 and s[-1] == "Z":
+        return datetime.datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                                 int(s[11:13]), int(s[14:16]), int(s[17:19]),
+                                 tzinfo=datetime.timezone.utc)
+    return datetime.datetime.fromisoformat(s.replace("Z", "+00:00"))
+
+# Transient statuses retried with exponential backoff (0.3s, 0.6s, 1.2s)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_RETRIES = 3
+
+def make_session() -> httpx.AsyncClient:
+    # Pooled keep-alive connections; the transport also retries failed connects
+    transport = httpx.AsyncHTTPTransport(
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=16, max_keepalive_connections=8),
+    )
+    return httpx.AsyncClient(transport=transport, timeout=30)
+
+async def yt_get(session: httpx.AsyncClient, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    for attempt in range(MAX_RETRIES + 1):
+        r = await session.get(url, params=params)
+        if r.status_code in RETRY_STATUSES and attempt < MAX_RETRIES:
+            await asyncio.sleep(0.3 * 2 ** attempt)
+            continue
+        r.raise_for_status()
+        return orjson.loads(r.content)
+
+async def iter_id_chunks(session: httpx.AsyncClient, playlist_id: str) -> AsyncIterator[List[str]]:
+    # Yields video IDs in chunks of 50 (the videos.list limit) as soon as they're available,
+    # so snippet fetches can start while pagination (serial, pageToken-chained) continues
+    chunk = []
     page_token = None
     while True:
         params = {
@@ -42,44 +82,48 @@ def fetch_all_playlist_video_ids(playlist_id: str) -> List[str]:
         if page_token:
             params["pageToken"] = page_token
 
-        data = yt_get("https://www.googleapis.com/youtube/v3/playlistItems", params)
+        data = await yt_get(session, "https://www.googleapis.com/youtube/v3/playlistItems", params)
         for item in data.get("items", []):
-            vid = item["contentDetails"]["videoId"]
-            video_ids.append(vid)
+            chunk.append(item["contentDetails"]["videoId"])
+            if len(chunk) == 50:
+                yield chunk
+                chunk = []
 
         page_token = data.get("nextPageToken")
         if not page_token:
             break
 
-    return video_ids
+    if chunk:
+        yield chunk
 
-def fetch_video_snippets(video_ids: List[str]) -> List[Dict[str, Any]]:
+async def fetch_video_snippets(session: httpx.AsyncClient, video_ids: List[str]) -> List[Dict[str, Any]]:
     # videos.list supports up to 50 ids per request
-    out = []
-    for i in range(0, len(video_ids), 50):
-        chunk = video_ids[i:i+50]
-        params = {
-            "part": "snippet",
-            "id": ",".join(chunk),
-            "maxResults": 50,
-            "key": YOUTUBE_API_KEY,
-        }
-        data = yt_get("https://www.googleapis.com/youtube/v3/videos", params)
-        out.extend(data.get("items", []))
-    return out
+    params = {
+        "part": "snippet",
+        "id": ",".join(video_ids),
+        "maxResults": 50,
+        "key": YOUTUBE_API_KEY,
+    }
+    data = await yt_get(session, "https://www.googleapis.com/youtube/v3/videos", params)
+    return data.get("items", [])
 
 def extract_chapters_from_description(description: str) -> List[Tuple[str, str, int]]:
     chapters = []
     for raw_line in description.splitlines():
-        line = raw_line.strip()
+        # Trailing whitespace doesn't affect the anchored match (the title is stripped below)
+        line = raw_line.lstrip()
         if not line:
             continue
-        m = CHAPTER_LINE_RE.match(line)
+        # Chapter lines start with an ASCII digit; skip narrative lines without running the regex
+        c = line[0]
+        if c < "0" or c > "9":
+            continue
+        m = _RE_DASH.match(line) or _RE_SPACE.match(line)
         if not m:
             continue
 
-        ts = m.group("ts") or m.group("ts2")
-        title = (m.group("title") or m.group("title2") or "").strip()
+        ts = m.group(1)
+        title = m.group(2).strip()
         if not ts or not title:
             continue
 
@@ -93,54 +137,67 @@ def extract_chapters_from_description(description: str) -> List[Tuple[str, str,
     # YouTube “chapters” usually start at 0:00; we won’t enforce it, just return what exists
     return chapters
 
+async def fetch_playlist_videos(playlist_id: str) -> List[Dict[str, Any]]:
+    # One client for both phases so TCP/TLS connections are reused
+    async with make_session() as session:
+        tasks = []
+        try:
+            async for chunk in iter_id_chunks(session, playlist_id):
+                tasks.append(asyncio.create_task(fetch_video_snippets(session, chunk)))
+            pages = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+    return [video for page in pages for video in page]
+
 def build_output(playlist_id: str) -> List[Dict[str, Any]]:
-    video_ids = fetch_all_playlist_video_ids(playlist_id)
-    videos = fetch_video_snippets(video_ids)
+    videos = asyncio.run(fetch_playlist_videos(playlist_id))
 
-    results = []
+    # Decorate each row with its precomputed sort key (published date, chapter time)
+    decorated = []
     for v in videos:
-        sn = v.get("snippet", {})
+        sn = v.get("snippet") or {}
         video_id = v.get("id")
         title = sn.get("title", "")
         description = sn.get("description", "")
         published_at = sn.get("publishedAt", "")
 
+        # publishedAt is RFC3339; string sort usually works, but we’ll be safe
+        try:
+            parsed_dt = _parse_yt_date(published_at)
+        except Exception:
+            parsed_dt = _DT_MIN
+
+        # Per-video fields are built once and shared by every chapter row
         video_url = f"https://www.youtube.com/watch?v={video_id}"
+        base = {
+            "playlist_id": playlist_id,
+            "video_id": video_id,
+            "video_title": title,
+            "publishedAt": published_at,
+            "video_url": video_url,
+        }
 
-        chapters = extract_chapters_from_description(description)
-        for (ts, chapter_title, seconds) in chapters:
-            chapter_url = f"{video_url}&t={seconds}s"
-            results.append({
-                "playlist_id": playlist_id,
-                "video_id": video_id,
-                "video_title": title,
-                "publishedAt": published_at,
-                "video_url": video_url,
+        for ts, chapter_title, seconds in extract_chapters_from_description(description):
+            decorated.append((parsed_dt, seconds, {
+                **base,
                 "chapter_title": chapter_title,
                 "chapter_timestamp": ts,
                 "chapter_seconds": seconds,
-                "chapter_url": chapter_url,
-                "description": description,
-            })
+                "chapter_url": f"{video_url}&t={seconds}s",
+            }))
 
     # Sort by published date then by chapter time
-    def sort_key(x):
-        # publishedAt is RFC3339; string sort usually works, but we’ll be safe
-        try:
-            dt = datetime.datetime.fromisoformat(x["publishedAt"].replace("Z", "+00:00"))
-        except Exception:
-            dt = datetime.datetime.min.replace(tzinfo=datetime.timezone.utc)
-        return (dt, x["chapter_seconds"])
-
-    results.sort(key=sort_key, reverse=True)
-    return results
+    decorated.sort(key=lambda t: (t[0], t[1]), reverse=True)
+    return [t[2] for t in decorated]
 
 def main():
     if not YOUTUBE_API_KEY:
         raise RuntimeError("Set YOUTUBE_API_KEY env var first.")
     data = build_output(PLAYLIST_ID)
-    with open("askswami_chapters.json", "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    with open("askswami_chapters.json", "wb") as f:
+        f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
     print(f"Wrote {len(data)} chapter entries to askswami_chapters.json")
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from dotenv import load_dotenv
 import os
@@ -10,7 +11,8 @@ load_dotenv()
 app = FastAPI(
     title="Expert Answers API",
     description="API for retrieving expert answers from YouTube video segments",
-    version="0.1.1"  # Updated for Azure deployment
+    version="0.1.1",  # Updated for Azure deployment
+    default_response_class=ORJSONResponse  # orjson serializes responses much faster than stdlib json
 )
 
 # CORS middleware
@@ -0,0 +1,45 @@
+"""
+Response models for the answers endpoints.
+"""
+
+from typing import Optional, List
+from pydantic import BaseModel
+
+
+class AnswerResponse(BaseModel):
+    videoLink: str
+    time: str
+    speakers: str
+    date: str
+    region: Optional[str] = None
+    score: Optional[str] = None
+    answerViewPoint: Optional[str] = None
+    thumbnail: Optional[str] = None
+    questionTitle: Optional[str] = None
+    playlistId: Optional[str] = None
+
+class TagSuggestion(BaseModel):
+    tag: str
+    count: int
+
+class SimilarQuestionForUpvote(BaseModel):
+    question: str
+    upvotes: int
+    inQueue: bool
+
+class QueueInfo(BaseModel):
+    questionInQueue: bool
+    upvotes: int
+    similarQuestions: Optional[List[SimilarQuestionForUpvote]] = None  # Similar questions for upvoting
+    canPostNewQuestion: bool = True  # Whether user can post their own question
+
+class AnswersResponseV1(BaseModel):
+    answers: List[AnswerResponse]
+    relatedQuestion: Optional[str] = None
+    relatedQuestions: Optional[List[str]] = None  # For fallback when no answers found
+    youtubeSearchResults: Optional[List[AnswerResponse]] = None  # For YouTube search fallback
+    searchStatus: Optional[str] = None  # "qa_match", "youtube_fallback", "tags_fallback", "no_results"
+    searchStage: Optional[str] = None  # "searching_questions", "searching_videos", "checking_relevance", "complete"
+    suggestedTags: Optional[List[TagSuggestion]] = None  # For tags fallback
+    queueInfo: Optional[QueueInfo] = None  # For queue/upvote info
+    userMessage: Optional[str] = None  # User-facing message explaining the result
@@ -1,15 +1,16 @@
+import asyncio
 from fastapi import APIRouter, HTTPException, Query, Body
 from typing import Optional, List, Dict
 from pydantic import BaseModel
-from datetime import datetime
 from app.services.youtube_service import (
-    search_videos, 
+    search_videos_async,
     format_video_link, 
     parse_date_range,
+    parse_youtube_date,
     extract_timestamp_from_description,
-    get_channel_details,
+    get_channel_details_async,
     infer_region_from_channel,
-    get_video_thumbnail,
+    get_video_thumbnail_async,
     search_sarvapriyananda_videos
 )
 from app.services.llm_service import match_question_with_llm, get_related_question, get_playlist_id, find_related_questions, distill_question_for_search, find_similar_questions_for_upvote, check_youtube_video_relevance, is_precanned_question
@@ -25,33 +26,13 @@ from app.services.cosmos_service import (
     find_similar_questions_in_queue
 )
 from app.services.search_service import search_all_methods
-
-class AnswerResponse(BaseModel):
-    videoLink: str
-    time: str
-    speakers: str
-    date: str
-    region: Optional[str] = None
-    score: Optional[str] = None
-    answerViewPoint: Optional[str] = None
-    thumbnail: Optional[str] = None
-    questionTitle: Optional[str] = None
-    playlistId: Optional[str] = None
-
-class TagSuggestion(BaseModel):
-    tag: str
-    count: int
-
-class SimilarQuestionForUpvote(BaseModel):
-    question: str
-    upvotes: int
-    inQueue: bool
-
-class QueueInfo(BaseModel):
-    questionInQueue: bool
-    upvotes: int
-    similarQuestions: Optional[List[SimilarQuestionForUpvote]] = None  # Similar questions for upvoting
-    canPostNewQuestion: bool = True  # Whether user can post their own question
+from app.models.answers import (
+    AnswerResponse,
+    TagSuggestion,
+    SimilarQuestionForUpvote,
+    QueueInfo,
+    AnswersResponseV1
+)
 
 def _build_queue_info(question: str) -> QueueInfo:
     """Helper function to build QueueInfo for a question"""
@@ -113,17 +94,6 @@ def _build_queue_info(question: str) -> QueueInfo:
         canPostNewQuestion=True
     )
 
-class AnswersResponseV1(BaseModel):
-    answers: List[AnswerResponse]
-    relatedQuestion: Optional[str] = None
-    relatedQuestions: Optional[List[str]] = None  # For fallback when no answers found
-    youtubeSearchResults: Optional[List[AnswerResponse]] = None  # For YouTube search fallback
-    searchStatus: Optional[str] = None  # "qa_match", "youtube_fallback", "tags_fallback", "no_results"
-    searchStage: Optional[str] = None  # "searching_questions", "searching_videos", "checking_relevance", "complete"
-    suggestedTags: Optional[List[TagSuggestion]] = None  # For tags fallback
-    queueInfo: Optional[QueueInfo] = None  # For queue/upvote info
-    userMessage: Optional[str] = None  # User-facing message explaining the result
-
 @router.get("/answers", response_model=List[AnswerResponse])
 async def get_answers(
     topic: str = Query(..., description="Topic of the question"),
@@ -149,23 +119,24 @@ async def get_answers(
         published_after, published_before = parse_date_range(dateRange)
         
         # Search YouTube
-        videos = search_videos(
+        videos = await search_videos_async(
             query=query,
             max_results=count,
             published_after=published_after,
             published_before=published_before
         )
         
+        # Fetch details for all distinct channels concurrently (cached process-wide)
+        channel_ids = list({video['channelId'] for video in videos if video.get('channelId')})
+        channel_details_list = await asyncio.gather(*[get_channel_details_async(cid) for cid in channel_ids])
+        channel_details_by_id = dict(zip(channel_ids, channel_details_list))
+        
         # Format response
         results = []
-        # Cache channel details to avoid multiple API calls for same channel
-        channel_cache = {}
         
         for video in videos:
             # Parse published date
-            published_date = datetime.fromisoformat(
-                video['publishedAt'].replace('Z', '+00:00')
-            ).strftime('%Y-%m-%d')
+            published_date = parse_youtube_date(video['publishedAt']).strftime('%Y-%m-%d')
             
             # Extract timestamp from description
             timestamp = extract_timestamp_from_description(
@@ -177,11 +148,7 @@ async def get_answers(
             region = None
             channel_id = video.get('channelId')
             if channel_id:
-                # Check cache first
-                if channel_id not in channel_cache:
-                    channel_cache[channel_id] = get_channel_details(channel_id)
-                
-                channel_details = channel_cache[channel_id]
+                channel_details = channel_details_by_id.get(channel_id)
                 region = infer_region_from_channel(
                     video.get('channelTitle', ''),
                     channel_details
@@ -241,20 +208,30 @@ async def get_answers_v1(
             results = []
             matched_question_texts = []
             
+            # Extract base video URL and video ID for every match up front
+            parsed_matches = []
             for match in matches:
-                # Extract base video URL and video ID
                 url = match['url']
-                base_url = url.split('&t=')[0] if '&t=' in url else url
+                base_url = url.partition('&t=')[0]
                 video_id = base_url.split('watch?v=')[1] if 'watch?v=' in base_url else None
-                
+                parsed_matches.append((match, base_url, video_id))
+            
+            # Fetch all thumbnails concurrently (one round-trip instead of one per match)
+            video_ids = list(dict.fromkeys(video_id for _, _, video_id in parsed_matches if video_id))
+            thumbnails = dict(zip(
+                video_ids,
+                await asyncio.gather(*[get_video_thumbnail_async(video_id) for video_id in video_ids])
+            ))
+            
+            for match, base_url, video_id in parsed_matches:
                 # Parse timestamp
                 timestamp = match.get('timestamp', '00:00:00')
                 
-                # Get thumbnail (sequential - YouTube API is usually fast)
+                # Thumbnail fetched above; playlist_id is a local lookup
                 thumbnail = None
                 playlist_id = None
                 if video_id:
-                    thumbnail = get_video_thumbnail(video_id)
+                    thumbnail = thumbnails.get(video_id)
                     playlist_id = get_playlist_id(video_id)
                 
                 # Get question text
@@ -307,21 +284,17 @@ async def get_answers_v1(
             return response
         
         # Step 2: No Q&A matches found - show tags and queue/upvote options
-        from app.routers.tags import load_tagged_chapters
+        from app.routers.tags import get_tagged_chapter_counts
         
         # Get tags
         suggested_tags = None
         try:
-            chapters = load_tagged_chapters()
-            # Count questions per tag
-            tag_counts: Dict[str, int] = {}
-            for chapter in chapters:
-                primary_tag = chapter.get("primary_tag", "Other")
-                tag_counts[primary_tag] = tag_counts.get(primary_tag, 0) + 1
+            # Question counts per tag (precomputed when the tagged chapters are loaded)
+            tag_counts = get_tagged_chapter_counts()
             
             # Convert to list and sort, but move "Other" to the end
             tags_list = [
-                TagSuggestion(tag=tag, count=count)
+                TagSuggestion.model_construct(tag=tag, count=count)
                 for tag, count in tag_counts.items()
             ]
             
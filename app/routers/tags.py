@@ -1,6 +1,13 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from typing import List, Dict, Any, Optional
+from collections import Counter
+from pathlib import Path
 from pydantic import BaseModel
+import hashlib
+import mmap
+import os
+import time
+import orjson
 from app.services.cosmos_service import get_cosmos_container
 from app.services.youtube_service import get_video_thumbnail
 from app.services.llm_service import get_playlist_id
@@ -40,6 +47,41 @@ MAIN_TAGS_DB = [
     'yoga',
 ]
 
+# Tagged chapters JSON (primary_tag per Q&A chapter), used for tag suggestions
+TAGGED_CHAPTERS_PATH = Path(__file__).parent.parent.parent / "askswami_chapters_tagged.json"
+_tagged_chapters_cache = None
+_tagged_chapters_mtime = None
+# Derived at load time so callers don't rescan the chapter list per request
+_tag_counts: Counter = Counter()  # primary_tag -> number of chapters
+
+def load_tagged_chapters() -> List[Dict]:
+    """
+    Load tagged chapters from askswami_chapters_tagged.json.
+    
+    The parsed list and its per-tag counts are cached, and reloaded only
+    when the file's mtime changes (so edits are picked up in dev without a restart).
+    """
+    global _tagged_chapters_cache, _tagged_chapters_mtime, _tag_counts
+    if not TAGGED_CHAPTERS_PATH.exists():
+        raise HTTPException(status_code=500, detail="askswami_chapters_tagged.json not found")
+    
+    mtime = TAGGED_CHAPTERS_PATH.stat().st_mtime
+    if _tagged_chapters_cache is None or mtime != _tagged_chapters_mtime:
+        with open(TAGGED_CHAPTERS_PATH, 'rb') as f, \
+             mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                chapters = orjson.loads(view)
+        
+        _tag_counts = Counter(chapter.get("primary_tag", "Other") for chapter in chapters)
+        _tagged_chapters_cache = chapters
+        _tagged_chapters_mtime = mtime
+    return _tagged_chapters_cache
+
+def get_tagged_chapter_counts() -> Counter:
+    """Get number of tagged chapters per primary_tag."""
+    load_tagged_chapters()
+    return _tag_counts
+
 def get_main_tags() -> List[str]:
     """Get list of main tags (static list derived from DB analysis)."""
     return MAIN_TAGS_DB
@@ -60,41 +102,51 @@ def _extract_timestamp_from_url(video_link: str) -> str:
         return ''
 
 
+# Display names for DB topics (several topics can share one display name)
+TOPIC_NAME_MAP = {
+    'artificial intelligence': 'AI',
+    'consciousness': 'Consciousness',
+    'philosophy': 'Philosophy',
+    'meditation': 'Meditation',
+    'enlightenment': 'Enlightenment',
+    'advaita': 'Advaita',
+    'karma': 'Karma',
+    'suffering': 'Suffering & Ethics',
+    'ethics': 'Suffering & Ethics',
+    'maya': 'Maya',
+    'mind': 'Mind',
+    'sleep': 'Sleep',
+    'buddhism': 'Buddhism',
+    'theology': 'Theology',
+    'bhakti': 'God & Devotion',
+    'devotion': 'God & Devotion',
+    'reality': 'Reality',
+    'realization': 'Realization',
+    'reincarnation': 'Reincarnation',
+    'experience': 'Experience',
+    'free will': 'Free Will',
+    'mindfulness': 'Mindfulness',
+    'non-duality': 'Non-Duality',
+    'personal development': 'Personal Development',
+    'prayer': 'Prayer',
+    'science': 'Science',
+    'spiritual life': 'Spiritual Life',
+    'spiritual practice': 'Spiritual Practice',
+    'universe': 'Universe',
+    'yoga': 'Yoga',
+}
+
 def normalize_topic_name(topic: str) -> str:
     """Normalize topic name for display (capitalize properly)."""
-    topic_name_map = {
-        'artificial intelligence': 'AI',
-        'consciousness': 'Consciousness',
-        'philosophy': 'Philosophy',
-        'meditation': 'Meditation',
-        'enlightenment': 'Enlightenment',
-        'advaita': 'Advaita',
-        'karma': 'Karma',
-        'suffering': 'Suffering & Ethics',
-        'ethics': 'Suffering & Ethics',
-        'maya': 'Maya',
-        'mind': 'Mind',
-        'sleep': 'Sleep',
-        'buddhism': 'Buddhism',
-        'theology': 'Theology',
-        'bhakti': 'God & Devotion',
-        'devotion': 'God & Devotion',
-        'reality': 'Reality',
-        'realization': 'Realization',
-        'reincarnation': 'Reincarnation',
-        'experience': 'Experience',
-        'free will': 'Free Will',
-        'mindfulness': 'Mindfulness',
-        'non-duality': 'Non-Duality',
-        'personal development': 'Personal Development',
-        'prayer': 'Prayer',
-        'science': 'Science',
-        'spiritual life': 'Spiritual Life',
-        'spiritual practice': 'Spiritual Practice',
-        'universe': 'Universe',
-        'yoga': 'Yoga',
-    }
-    return topic_name_map.get(topic.lower(), topic.title())
+    return TOPIC_NAME_MAP.get(topic.lower(), topic.title())
+
+# Precomputed lookups so requests don't rescan MAIN_TAGS_DB:
+# set membership for "has a main tag" checks, and lowercase display tag -> DB topic
+# (first topic wins when several share a display name, matching the old linear scan)
+MAIN_TAGS_SET = frozenset(MAIN_TAGS_DB)
+_DISPLAY_TAG_TO_TOPIC: Dict[str, str] = {}
+for _topic in MAIN_TAGS_DB:
+    _DISPLAY_TAG_TO_TOPIC.setdefault(normalize_topic_name(_topic).lower(), _topic)
 
 
 class TagInfo(BaseModel):
@@ -102,6 +154,29 @@ class TagInfo(BaseModel):
     count: int
 
 
+# Cache for the /tags response: building it takes ~30 Cosmos DB queries plus a scan,
+# so it is recomputed at most once per TTL (new questions show up after the TTL expires)
+TAGS_CACHE_TTL_SECONDS = int(os.getenv('TAGS_CACHE_TTL_SECONDS', '300'))
+_tags_response_cache: Optional[List[TagInfo]] = None
+_tags_response_cache_time = 0.0
+# Pre-serialized JSON body of the cached response and its strong ETag
+_tags_response_body: Optional[bytes] = None
+_tags_response_etag: Optional[str] = None
+
+def _cached_tags_response(request: Request) -> Response:
+    """Serve the cached /tags body, or 304 if the client already has this version."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        client_etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+        if _tags_response_etag in client_etags or "*" in client_etags:
+            return Response(status_code=304, headers={"ETag": _tags_response_etag})
+    return Response(
+        content=_tags_response_body,
+        media_type="application/json",
+        headers={"ETag": _tags_response_etag}
+    )
+
+
 class TaggedQuestion(BaseModel):
     question: str
     url: str
@@ -112,14 +187,21 @@ class TaggedQuestion(BaseModel):
 
 
 @router.get("/tags", response_model=List[TagInfo])
-async def get_tags():
+async def get_tags(request: Request):
     """Get all available tags with question counts from Cosmos DB."""
+    global _tags_response_cache, _tags_response_cache_time, _tags_response_body, _tags_response_etag
+    if _tags_response_cache is not None and \
+       time.monotonic() - _tags_response_cache_time < TAGS_CACHE_TTL_SECONDS:
+        return _cached_tags_response(request)
+    
     try:
         container = get_cosmos_container()
         main_tags = get_main_tags()
         
         # Count questions for each main tag using COUNT queries (fast)
         tag_counts: Dict[str, int] = {}
+        # Partial results (some queries failed) are returned but not cached
+        had_errors = False
         
         for main_topic in main_tags:
             query = """
@@ -143,6 +225,7 @@ async def get_tags():
                     normalized_tag = normalize_topic_name(main_topic)
                     tag_counts[normalized_tag] = count
             except Exception as e:
+                had_errors = True
                 print(f"Error counting tag {main_topic}: {e}")
                 import traceback
                 print(traceback.format_exc())
@@ -179,7 +262,7 @@ async def get_tags():
                 # Check if question has any main tag
                 has_main_tag = False
                 for topic in topics:
-                    if topic and topic.lower().strip() in main_tags:
+                    if topic and topic.lower().strip() in MAIN_TAGS_SET:
                         has_main_tag = True
                         break
                 
@@ -190,13 +273,14 @@ async def get_tags():
                 tag_counts['Other'] = other_count
                 print(f"Found {other_count} questions in 'Other' category")
         except Exception as e:
+            had_errors = True
             print(f"Error counting Other: {e}")
             import traceback
             print(traceback.format_exc())
         
         # Convert to list and sort
         tags_list = [
-            TagInfo(tag=tag, count=count)
+            TagInfo.model_construct(tag=tag, count=count)
             for tag, count in tag_counts.items()
         ]
         
@@ -208,6 +292,12 @@ async def get_tags():
         
         tags = sorted(tags_list, key=sort_key)
         print(f"Returning {len(tags)} tags")
+        if not had_errors:
+            _tags_response_body = orjson.dumps([tag_info.model_dump() for tag_info in tags])
+            _tags_response_etag = f'"{hashlib.blake2b(_tags_response_body, digest_size=8).hexdigest()}"'
+            _tags_response_cache = tags
+            _tags_response_cache_time = time.monotonic()
+            return _cached_tags_response(request)
         return tags
     
     except Exception as e:
@@ -221,7 +311,6 @@ async def get_tags():
 async def get_questions_by_tag(tag: str, include_thumbnails: bool = Query(False, description="Include thumbnails (slower but better UX)")):
     """Get all questions for a specific tag from Cosmos DB."""
     container = get_cosmos_container()
-    main_tags = get_main_tags()
     
     tag_lower = tag.lower()
     
@@ -249,7 +338,7 @@ async def get_questions_by_tag(tag: str, include_thumbnails: bool = Query(False,
             topics = item.get('topics', [])
             has_main_tag = False
             for topic in topics:
-                if topic and topic.lower() in main_tags:
+                if topic and topic.lower() in MAIN_TAGS_SET:
                     has_main_tag = True
                     break
             if not has_main_tag:
@@ -259,7 +348,7 @@ async def get_questions_by_tag(tag: str, include_thumbnails: bool = Query(False,
         for item in other_questions:
             # Extract timestamp from video_link if present
             video_link = item.get('video_link', '')
-            base_url = video_link.split('&t=')[0] if '&t=' in video_link else video_link
+            base_url = video_link.partition('&t=')[0]
             video_id = base_url.split('watch?v=')[1] if 'watch?v=' in base_url else None
             timestamp = _extract_timestamp_from_url(video_link)
             
@@ -286,11 +375,7 @@ async def get_questions_by_tag(tag: str, include_thumbnails: bool = Query(False,
         return questions
     
     # For specific tags, find matching topic in main_tags
-    matching_topic = None
-    for main_topic in main_tags:
-        if normalize_topic_name(main_topic).lower() == tag_lower:
-            matching_topic = main_topic
-            break
+    matching_topic = _DISPLAY_TAG_TO_TOPIC.get(tag_lower)
     
     if not matching_topic:
         return []
@@ -317,7 +402,7 @@ async def get_questions_by_tag(tag: str, include_thumbnails: bool = Query(False,
     questions = []
     for item in items:
         video_link = item.get('video_link', '')
-        base_url = video_link.split('&t=')[0] if '&t=' in video_link else video_link
+        base_url = video_link.partition('&t=')[0]
         video_id = base_url.split('watch?v=')[1] if 'watch?v=' in base_url else None
         timestamp = _extract_timestamp_from_url(video_link)
         
@@ -410,7 +495,7 @@ async def search_questions_by_topic(query: str, include_thumbnails: bool = Query
     if include_thumbnails and matching_items:
         for item in matching_items:
             video_link = item.get('video_link', '')
-            base_url = video_link.split('&t=')[0] if '&t=' in video_link else video_link
+            base_url = video_link.partition('&t=')[0]
             video_id = base_url.split('watch?v=')[1] if 'watch?v=' in base_url else None
             timestamp = _extract_timestamp_from_url(video_link)
             
@@ -436,7 +521,7 @@ async def search_questions_by_topic(query: str, include_thumbnails: bool = Query
         # Fast path: skip thumbnails
         for item in matching_items:
             video_link = item.get('video_link', '')
-            base_url = video_link.split('&t=')[0] if '&t=' in video_link else video_link
+            base_url = video_link.partition('&t=')[0]
             timestamp = _extract_timestamp_from_url(video_link)
             
             questions.append({
@@ -1,12 +1,20 @@
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from cachetools import TTLCache
+import httpx
 import os
+import re
 import ssl
+import threading
+from functools import lru_cache, wraps
 from typing import List, Optional, Dict
-from datetime import datetime
+from datetime import datetime, timezone
 
 # Initialize YouTube API client
 youtube_service = None
+# Async HTTP client for calling the YouTube Data API directly (shared connection pool)
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+_async_client = None
 
 def get_youtube_service():
     """Initialize and return YouTube API service client"""
@@ -15,9 +23,93 @@ def get_youtube_service():
         api_key = os.getenv('YOUTUBE_API_KEY')
         if not api_key:
             raise ValueError("YOUTUBE_API_KEY not found in environment variables")
-        youtube_service = build('youtube', 'v3', developerKey=api_key)
+        # Use the discovery document bundled with google-api-python-client, so building
+        # the client never fetches it over the network on cold start
+        youtube_service = build('youtube', 'v3', developerKey=api_key, static_discovery=True)
     return youtube_service
 
+def get_async_client() -> httpx.AsyncClient:
+    """Initialize and return the shared async HTTP client for the YouTube Data API"""
+    global _async_client
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(base_url=YOUTUBE_API_BASE_URL, timeout=30)
+    return _async_client
+
+async def _youtube_api_get(path: str, params: Dict) -> Dict:
+    """GET a YouTube Data API v3 resource with the shared async client and return the parsed JSON"""
+    api_key = os.getenv('YOUTUBE_API_KEY')
+    if not api_key:
+        raise ValueError("YOUTUBE_API_KEY not found in environment variables")
+    response = await get_async_client().get(path, params={**params, 'key': api_key})
+    response.raise_for_status()
+    return response.json()
+
+# Process-wide caches for per-video/per-channel lookups, shared across requests
+_thumbnail_cache = TTLCache(maxsize=4096, ttl=3600)
+_channel_cache = TTLCache(maxsize=4096, ttl=3600)
+_cache_lock = threading.Lock()
+
+def _ttl_cached(cache: TTLCache):
+    """Memoize a single-argument lookup in a shared TTL cache (None results are not cached, so errors get retried)."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(key):
+            with _cache_lock:
+                value = cache.get(key)
+            if value is not None:
+                return value
+            value = func(key)
+            if value is not None:
+                with _cache_lock:
+                    cache[key] = value
+            return value
+        return wrapper
+    return decorator
+
+def _build_search_params(
+    query: str,
+    channel_id: Optional[str],
+    max_results: int,
+    published_after: Optional[str],
+    published_before: Optional[str]
+) -> Dict:
+    """Build search.list request parameters (shared by search_videos and search_videos_async)"""
+    request_params = {
+        'part': 'snippet',
+        'q': query,
+        'type': 'video',
+        'maxResults': min(max_results, 50),
+        'order': 'relevance'
+    }
+    
+    if channel_id:
+        request_params['channelId'] = channel_id
+    
+    if published_after:
+        request_params['publishedAfter'] = published_after
+    
+    if published_before:
+        request_params['publishedBefore'] = published_before
+    
+    return request_params
+
+def _parse_search_items(response: Dict) -> List[Dict]:
+    """Extract video information from a search.list response"""
+    videos = []
+    for item in response.get('items', []):
+        video_data = {
+            'videoId': item['id']['videoId'],
+            'title': item['snippet']['title'],
+            'description': item['snippet']['description'],
+            'publishedAt': item['snippet']['publishedAt'],
+            'channelTitle': item['snippet']['channelTitle'],
+            'channelId': item['snippet']['channelId'],
+            'thumbnail': item['snippet']['thumbnails'].get('default', {}).get('url', '')
+        }
+        videos.append(video_data)
+    
+    return videos
+
 def search_videos(
     query: str,
     channel_id: Optional[str] = None,
@@ -41,43 +133,13 @@ def search_videos(
     try:
         service = get_youtube_service()
         
-        # Build search request
-        request_params = {
-            'part': 'snippet',
-            'q': query,
-            'type': 'video',
-            'maxResults': min(max_results, 50),
-            'order': 'relevance'
-        }
-        
-        if channel_id:
-            request_params['channelId'] = channel_id
-        
-        if published_after:
-            request_params['publishedAfter'] = published_after
-        
-        if published_before:
-            request_params['publishedBefore'] = published_before
-        
         # Execute search
-        request = service.search().list(**request_params)
+        request = service.search().list(**_build_search_params(
+            query, channel_id, max_results, published_after, published_before
+        ))
         response = request.execute()
         
-        # Extract video information
-        videos = []
-        for item in response.get('items', []):
-            video_data = {
-                'videoId': item['id']['videoId'],
-                'title': item['snippet']['title'],
-                'description': item['snippet']['description'],
-                'publishedAt': item['snippet']['publishedAt'],
-                'channelTitle': item['snippet']['channelTitle'],
-                'channelId': item['snippet']['channelId'],
-                'thumbnail': item['snippet']['thumbnails'].get('default', {}).get('url', '')
-            }
-            videos.append(video_data)
-        
-        return videos
+        return _parse_search_items(response)
     
     except ssl.SSLError as e:
         print(f"SSL error searching YouTube: {e}")
@@ -89,10 +151,45 @@ def search_videos(
         print(f"Error searching YouTube: {e}")
         raise
 
+async def search_videos_async(
+    query: str,
+    channel_id: Optional[str] = None,
+    max_results: int = 10,
+    published_after: Optional[str] = None,
+    published_before: Optional[str] = None
+) -> List[Dict]:
+    """
+    Async variant of search_videos using the shared httpx client, so it can be awaited
+    alongside other YouTube calls without blocking the event loop
+    
+    Args:
+        query: Search query string
+        channel_id: Optional channel ID to filter by
+        max_results: Maximum number of results (default: 10, max: 50)
+        published_after: ISO 8601 date string (e.g., '2024-01-01T00:00:00Z')
+        published_before: ISO 8601 date string
+    
+    Returns:
+        List of video dictionaries with id, title, description, publishedAt, channelTitle
+    """
+    try:
+        response = await _youtube_api_get('/search', _build_search_params(
+            query, channel_id, max_results, published_after, published_before
+        ))
+        return _parse_search_items(response)
+    
+    except httpx.HTTPError as e:
+        print(f"YouTube API error: {e}")
+        raise Exception(f"YouTube API error: {str(e)}")
+    except Exception as e:
+        print(f"Error searching YouTube: {e}")
+        raise
+
 def format_video_link(video_id: str) -> str:
     """Format video ID into YouTube URL"""
     return f"https://www.youtube.com/watch?v={video_id}"
 
+@_ttl_cached(_thumbnail_cache)
 def get_video_thumbnail(video_id: str) -> Optional[str]:
     """
     Get thumbnail URL for a video
@@ -127,6 +224,39 @@ def get_video_thumbnail(video_id: str) -> Optional[str]:
     
     return None
 
+async def get_video_thumbnail_async(video_id: str) -> Optional[str]:
+    """
+    Async variant of get_video_thumbnail, so several videos can be fetched concurrently
+    
+    Args:
+        video_id: YouTube video ID
+    
+    Returns:
+        Thumbnail URL or None if error
+    """
+    with _cache_lock:
+        thumbnail = _thumbnail_cache.get(video_id)
+    if thumbnail is not None:
+        return thumbnail
+    
+    try:
+        data = await _youtube_api_get('/videos', {'part': 'snippet', 'id': video_id})
+        
+        if data.get('items'):
+            thumbnails = data['items'][0]['snippet']['thumbnails']
+            # Prefer medium quality, fallback to default
+            thumbnail = thumbnails.get('medium', {}).get('url') or thumbnails.get('default', {}).get('url', '')
+            with _cache_lock:
+                _thumbnail_cache[video_id] = thumbnail
+            return thumbnail
+    except httpx.HTTPError as e:
+        # Log HTTP/network errors from YouTube API
+        print(f"YouTube API error fetching thumbnail for {video_id}: {e}")
+    except Exception as e:
+        print(f"Error fetching thumbnail for {video_id}: {e}")
+    
+    return None
+
 def parse_date_range(date_range: Optional[str]) -> tuple[Optional[str], Optional[str]]:
     """
     Parse date range string into published_after and published_before
@@ -154,6 +284,34 @@ def parse_date_range(date_range: Optional[str]) -> tuple[Optional[str], Optional
     
     return None, None
 
+@lru_cache(maxsize=4096)
+def parse_youtube_date(value: str) -> datetime:
+    """
+    Parse an RFC 3339 publishedAt value from the YouTube API
+    
+    YouTube always uses the fixed "YYYY-MM-DDTHH:MM:SSZ" form, which is sliced
+    directly; anything else falls back to datetime.fromisoformat.
+    
+    Args:
+        value: publishedAt string
+    
+    Returns:
+        Timezone-aware datetime in UTC
+    """
+    if len(value) == 20 and value[-1] == 'Z':
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=timezone.utc
+        )
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Timestamp patterns for extract_timestamp_from_description
+_TS_P1 = re.compile(r'\b(\d{1,2}):(\d{2}):(\d{2})\b')  # HH:MM:SS
+_TS_P2 = re.compile(r'\b(\d{1,2}):(\d{2})\b')  # MM:SS
+_TS_P3 = re.compile(r'(?:at|timestamp|time|start|begins?)\s*:?\s*(\d{1,2}):(\d{2})(?::(\d{2}))?')
+
+@lru_cache(maxsize=1024)
 def extract_timestamp_from_description(description: str, title: str = "") -> Optional[str]:
     """
     Extract timestamp from video description or title.
@@ -166,35 +324,31 @@ def extract_timestamp_from_description(description: str, title: str = "") -> Opt
     Returns:
         Timestamp string in HH:MM:SS format, or None if not found
     """
-    import re
-    
     # Combine title and description for searching
     text = f"{title} {description}".lower()
     
     # Pattern 1: HH:MM:SS format (e.g., "1:23:45", "00:05:30")
-    pattern1 = r'\b(\d{1,2}):(\d{2}):(\d{2})\b'
-    matches = re.findall(pattern1, text)
+    matches = _TS_P1.findall(text)
     if matches:
         # Take the first match
         h, m, s = matches[0]
         return f"{int(h):02d}:{int(m):02d}:{int(s):02d}"
     
     # Pattern 2: MM:SS format (e.g., "5:30", "10:15")
-    pattern2 = r'\b(\d{1,2}):(\d{2})\b'
-    matches = re.findall(pattern2, text)
+    matches = _TS_P2.findall(text)
     if matches:
         # Filter out likely false positives (like dates, URLs)
         for match in matches:
             m, s = match
+            pos = text.find(f"{m}:{s}")
             # Skip if it looks like a date (month:day) or URL
-            if int(m) <= 12 and 'http' not in text[max(0, text.find(f"{m}:{s}")-10):text.find(f"{m}:{s}")+10]:
+            if int(m) <= 12 and 'http' not in text[max(0, pos-10):pos+10]:
                 # Check if it's a reasonable timestamp (minutes < 60)
                 if int(m) < 60:
                     return f"00:{int(m):02d}:{int(s):02d}"
     
     # Pattern 3: Look for "at X:XX" or "timestamp X:XX" patterns
-    pattern3 = r'(?:at|timestamp|time|start|begins?)\s*:?\s*(\d{1,2}):(\d{2})(?::(\d{2}))?'
-    matches = re.findall(pattern3, text)
+    matches = _TS_P3.findall(text)
     if matches:
         match = matches[0]
         if len(match) == 3 and match[2]:  # Has seconds
@@ -207,6 +361,17 @@ def extract_timestamp_from_description(description: str, title: str = "") -> Opt
     
     return None
 
+def _parse_channel(channel: Dict) -> Dict:
+    """Extract the fields we use from a channels.list item"""
+    snippet = channel.get('snippet', {})
+    return {
+        'title': snippet.get('title', ''),
+        'description': snippet.get('description', ''),
+        'country': snippet.get('country', ''),
+        'customUrl': snippet.get('customUrl', '')
+    }
+
+@_ttl_cached(_channel_cache)
 def get_channel_details(channel_id: str) -> Optional[Dict]:
     """
     Get channel details including location/region information
@@ -226,14 +391,7 @@ def get_channel_details(channel_id: str) -> Optional[Dict]:
         response = request.execute()
         
         if response.get('items'):
-            channel = response['items'][0]
-            snippet = channel.get('snippet', {})
-            return {
-                'title': snippet.get('title', ''),
-                'description': snippet.get('description', ''),
-                'country': snippet.get('country', ''),
-                'customUrl': snippet.get('customUrl', '')
-            }
+            return _parse_channel(response['items'][0])
     except ssl.SSLError as e:
         # Log SSL errors but don't crash
         print(f"SSL error fetching channel details for {channel_id}: {e}")
@@ -245,6 +403,62 @@ def get_channel_details(channel_id: str) -> Optional[Dict]:
     
     return None
 
+async def get_channel_details_async(channel_id: str) -> Optional[Dict]:
+    """
+    Async variant of get_channel_details, sharing its process-wide cache
+    
+    Args:
+        channel_id: YouTube channel ID
+    
+    Returns:
+        Dictionary with channel details including location, or None if error
+    """
+    with _cache_lock:
+        details = _channel_cache.get(channel_id)
+    if details is not None:
+        return details
+    
+    try:
+        response = await _youtube_api_get('/channels', {'part': 'snippet,contentDetails', 'id': channel_id})
+        
+        if response.get('items'):
+            details = _parse_channel(response['items'][0])
+            with _cache_lock:
+                _channel_cache[channel_id] = details
+            return details
+    except httpx.HTTPError as e:
+        # Log HTTP/network errors from YouTube API
+        print(f"YouTube API error fetching channel details for {channel_id}: {e}")
+    except Exception as e:
+        print(f"Error fetching channel details for {channel_id}: {e}")
+    
+    return None
+
+# Map common country codes to readable names
+COUNTRY_NAME_MAP = {
+    'US': 'United States',
+    'IN': 'India',
+    'GB': 'United Kingdom',
+    'CA': 'Canada',
+    'AU': 'Australia',
+    'DE': 'Germany',
+    'FR': 'France',
+    'JP': 'Japan',
+    'CN': 'China'
+}
+
+# Channel title keywords -> region (checked in order, first match wins)
+REGION_KEYWORDS = {
+    'new york': 'United States',
+    'california': 'United States',
+    'london': 'United Kingdom',
+    'mumbai': 'India',
+    'delhi': 'India',
+    'bangalore': 'India',
+    'sydney': 'Australia',
+    'toronto': 'Canada'
+}
+
 def infer_region_from_channel(channel_title: str, channel_details: Optional[Dict] = None) -> Optional[str]:
     """
     Infer region from channel information
@@ -259,34 +473,12 @@ def infer_region_from_channel(channel_title: str, channel_details: Optional[Dict
     # Check channel details first
     if channel_details and channel_details.get('country'):
         country_code = channel_details['country']
-        # Map common country codes to readable names
-        country_map = {
-            'US': 'United States',
-            'IN': 'India',
-            'GB': 'United Kingdom',
-            'CA': 'Canada',
-            'AU': 'Australia',
-            'DE': 'Germany',
-            'FR': 'France',
-            'JP': 'Japan',
-            'CN': 'China'
-        }
-        return country_map.get(country_code, country_code)
+        return COUNTRY_NAME_MAP.get(country_code, country_code)
     
     # Try to infer from channel title
     title_lower = channel_title.lower()
-    region_keywords = {
-        'new york': 'United States',
-        'california': 'United States',
-        'london': 'United Kingdom',
-        'mumbai': 'India',
-        'delhi': 'India',
-        'bangalore': 'India',
-        'sydney': 'Australia',
-        'toronto': 'Canada'
-    }
     
-    for keyword, region in region_keywords.items():
+    for keyword, region in REGION_KEYWORDS.items():
         if keyword in title_lower:
             return region
     
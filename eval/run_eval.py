@@ -4,27 +4,139 @@ Evaluation script for Expert Answers API.
 Runs queries from golden_set.json and compares results with expected answers.
 """
 
-import json
-import requests
+import asyncio
+import hashlib
+import os
+import pickle
+import httpx
+import numpy as np
+import orjson
 import sys
-from typing import Dict, List, Any
+import time
+from typing import Callable, Dict, List, Any, Optional
 from pathlib import Path
-from datetime import datetime
+from functools import lru_cache
+
+try:
+    # pyahocorasick matches all expected questions against a result title in one pass
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Configuration
 API_BASE_URL = "http://localhost:8000"
 GOLDEN_SET_PATH = Path(__file__).parent / "golden_set.json"
 RESULTS_DIR = Path(__file__).parent / "results"
 SCORES_FILE = Path(__file__).parent / "scores.json"
+# Maximum number of in-flight API requests (the adaptive limiter backs off below this on 429/5xx)
+EVAL_CONCURRENCY = int(os.environ.get("EVAL_CONCURRENCY", "10"))
+# Transient failures (rate limits, 5xx, timeouts, dropped connections) are retried with backoff
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+MAX_ATTEMPTS = 3
+# Set EVAL_CACHE=1 to reuse API responses from earlier runs (keyed by base URL, query and count).
+# Off by default: cached responses don't reflect backend changes.
+EVAL_CACHE = os.environ.get("EVAL_CACHE", "") not in ("", "0")
+API_CACHE_DIR = RESULTS_DIR / "api_cache"
+# Fields of each API answer kept in the results file for review
+STORED_ANSWER_FIELDS = ("questionTitle", "videoLink", "time", "score")
+
+
+# Directories already created by this process
+_ready_dirs = set()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create a directory (and parents) once per process."""
+    if path not in _ready_dirs:
+        path.mkdir(parents=True, exist_ok=True)
+        _ready_dirs.add(path)
 
 
 def load_golden_set() -> Dict[str, Any]:
-    """Load the golden evaluation set."""
-    with open(GOLDEN_SET_PATH, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    """
+    Load the golden evaluation set.
+    Each query gets a precomputed "_api_count" and each expected answer a "_norm"
+    (normalized question text).
+    The processed set is pickled in RESULTS_DIR, keyed by the golden set's mtime and size,
+    so reruns against an unchanged golden set skip parsing and normalization.
+    """
+    stat = GOLDEN_SET_PATH.stat()
+    cache_path = RESULTS_DIR / f"golden_{stat.st_mtime_ns}_{stat.st_size}.pkl"
+    if cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError) as e:
+            print(f"⚠️ Ignoring unreadable golden set cache {cache_path.name}: {e}")
+    
+    with open(GOLDEN_SET_PATH, 'rb') as f:
+        golden_set = orjson.loads(f.read())
+    
+    for query_data in golden_set.get("queries", []):
+        # The API requires count >= 1; queries that expect 0 results still check what comes back
+        query_data["_api_count"] = max(query_data.get("max_results_to_check", 5), 1)
+        for expected in query_data.get("expected_answers", []):
+            expected["_norm"] = normalize_question(expected["question"])
+    
+    try:
+        _ensure_dir(RESULTS_DIR)
+        # Drop caches of older golden set versions
+        for stale in RESULTS_DIR.glob("golden_*.pkl"):
+            stale.unlink()
+        with open(cache_path, 'wb') as f:
+            pickle.dump(golden_set, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"⚠️ Could not cache golden set: {e}")
+    
+    return golden_set
+
+
+class AdaptiveLimiter:
+    """
+    Async context manager capping in-flight API requests, with an AIMD-style adaptive cap:
+    the cap halves when the API throttles (429/5xx/timeouts) and doubles after a full
+    window of consecutive successes, up to max_limit.
+    """
+    
+    def __init__(self, limit: int, max_limit: int):
+        self.max_limit = max(1, max_limit)
+        self.limit = min(max(1, limit), self.max_limit)
+        self.in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self) -> "AdaptiveLimiter":
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+    
+    async def on_success(self) -> None:
+        async with self._condition:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_limit:
+                self.limit = min(self.limit * 2, self.max_limit)
+                self._successes = 0
+                self._condition.notify_all()
+    
+    async def on_throttle(self) -> None:
+        async with self._condition:
+            self.limit = max(1, self.limit // 2)
+            self._successes = 0
 
 
-def call_api(query: str, count: int = 5) -> Dict[str, Any]:
+async def call_api(
+    client: httpx.AsyncClient,
+    limiter: AdaptiveLimiter,
+    query: str,
+    count: int = 5,
+    log: Callable[[str], None] = print
+) -> Dict[str, Any]:
     """Call the Expert Answers API with a query."""
     url = f"{API_BASE_URL}/api/answers/v1"
     params = {
@@ -32,57 +144,184 @@ def call_api(query: str, count: int = 5) -> Dict[str, Any]:
         "count": count
     }
     
-    try:
-        response = requests.get(url, params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        print(f"  ❌ API Error: {e}")
-        return None
+    cache_path = None
+    if EVAL_CACHE:
+        key = hashlib.blake2b(f"{API_BASE_URL}|{query}|{count}".encode(), digest_size=16).hexdigest()
+        cache_path = API_CACHE_DIR / f"{key}.json"
+        if cache_path.exists():
+            try:
+                return orjson.loads(cache_path.read_bytes())
+            except (OSError, ValueError) as e:
+                # Treat a truncated/corrupt entry as a miss; it is overwritten below
+                log(f"  ⚠️ Ignoring unreadable API cache entry {cache_path.name}: {e}")
+    
+    for attempt in range(MAX_ATTEMPTS):
+        last_attempt = attempt == MAX_ATTEMPTS - 1
+        try:
+            async with limiter:
+                response = await client.get(url, params=params, timeout=30)
+            if response.status_code in RETRY_STATUSES:
+                await limiter.on_throttle()
+                if not last_attempt:
+                    log(f"  ⚠️ API returned {response.status_code}, retrying...")
+                    await asyncio.sleep(0.5 * 2 ** attempt)
+                    continue
+            response.raise_for_status()
+            await limiter.on_success()
+            api_response = orjson.loads(response.content)
+            if cache_path is not None:
+                # Write to a temp file and rename, so an interrupted run never leaves a partial entry
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                try:
+                    _ensure_dir(API_CACHE_DIR)
+                    tmp_path.write_bytes(response.content)
+                    os.replace(tmp_path, cache_path)
+                except OSError as e:
+                    log(f"  ⚠️ Could not cache API response: {e}")
+            return api_response
+        except httpx.TransportError as e:
+            # Timeouts and connection errors
+            await limiter.on_throttle()
+            if not last_attempt:
+                log(f"  ⚠️ API Error: {e!r}, retrying...")
+                await asyncio.sleep(0.5 * 2 ** attempt)
+                continue
+            log(f"  ❌ API Error: {e}")
+            return None
+        except httpx.HTTPError as e:
+            log(f"  ❌ API Error: {e}")
+            return None
+        except ValueError as e:
+            # Non-JSON body (orjson.JSONDecodeError is a ValueError)
+            log(f"  ❌ API Error: invalid JSON response: {e}")
+            return None
 
 
+@lru_cache(maxsize=8192)
 def normalize_question(question: str) -> str:
     """Normalize question text for comparison (lowercase, strip whitespace)."""
     return question.lower().strip()
 
 
-def find_answer_in_results(expected: Dict[str, Any], actual_results: List[Dict[str, Any]]) -> tuple[bool, int]:
+def find_answer_in_results(
+    expected_norm: str,
+    expected_url_pattern: Optional[str],
+    actual_norm: List[str],
+    actual_urls: List[str]
+) -> tuple[bool, int]:
     """
     Check if expected answer is in actual results.
+    Takes the normalized expected question and the normalized titles / URLs of the results.
     Returns (found, rank) where rank is 1-based position, or 0 if not found.
     """
-    expected_question = normalize_question(expected["question"])
-    
-    for idx, result in enumerate(actual_results, start=1):
-        actual_question = normalize_question(result.get("questionTitle", ""))
-        
+    for idx, actual_question in enumerate(actual_norm, start=1):
         # Check if question matches (exact or contains)
-        if expected_question in actual_question or actual_question in expected_question:
+        if expected_norm in actual_question or actual_question in expected_norm:
             # Check URL pattern if specified
-            if "url_pattern" in expected:
-                url = result.get("videoLink", "")
-                if expected["url_pattern"] not in url:
-                    continue
+            if expected_url_pattern is not None and expected_url_pattern not in actual_urls[idx - 1]:
+                continue
             
             return True, idx
     
     return False, 0
 
 
-def evaluate_query(query_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Evaluate a single query against the API."""
+def _build_automaton(words: List[str]):
+    """
+    Build an Aho-Corasick automaton mapping each non-empty word to the indices it occurs at.
+    Returns (automaton or None if there are no non-empty words, indices of empty words).
+    """
+    indices_by_word: Dict[str, List[int]] = {}
+    empty_indices = []
+    for i, word in enumerate(words):
+        if word:
+            indices_by_word.setdefault(word, []).append(i)
+        else:
+            empty_indices.append(i)
+    
+    if not indices_by_word:
+        return None, empty_indices
+    
+    automaton = ahocorasick.Automaton()
+    for word, indices in indices_by_word.items():
+        automaton.add_word(word, indices)
+    automaton.make_automaton()
+    return automaton, empty_indices
+
+
+def find_answers_in_results(
+    expected_norms: List[str],
+    expected_url_patterns: List[Optional[str]],
+    actual_norm: List[str],
+    actual_urls: List[str]
+) -> List[tuple[bool, int]]:
+    """
+    Same as calling find_answer_in_results for every expected answer, but the containment
+    checks (expected in actual, and actual in expected) are done with one Aho-Corasick
+    scan per string instead of a substring test per (expected, result) pair.
+    """
+    if ahocorasick is None:
+        return [
+            find_answer_in_results(expected_norm, url_pattern, actual_norm, actual_urls)
+            for expected_norm, url_pattern in zip(expected_norms, expected_url_patterns)
+        ]
+    
+    # Candidate 1-based ranks per expected answer
+    candidate_ranks = [set() for _ in expected_norms]
+    
+    # Expected question contained in a result title
+    expected_automaton, empty_expected = _build_automaton(expected_norms)
+    for idx, actual_question in enumerate(actual_norm, start=1):
+        if expected_automaton is not None:
+            for _, expected_indices in expected_automaton.iter(actual_question):
+                for i in expected_indices:
+                    candidate_ranks[i].add(idx)
+        # An empty string is contained in everything
+        for i in empty_expected:
+            candidate_ranks[i].add(idx)
+    
+    # Result title contained in an expected question
+    actual_automaton, empty_actual = _build_automaton(actual_norm)
+    for i, expected_norm in enumerate(expected_norms):
+        if actual_automaton is not None:
+            for _, actual_indices in actual_automaton.iter(expected_norm):
+                candidate_ranks[i].update(j + 1 for j in actual_indices)
+        candidate_ranks[i].update(j + 1 for j in empty_actual)
+    
+    results = []
+    for ranks, url_pattern in zip(candidate_ranks, expected_url_patterns):
+        for idx in sorted(ranks):
+            # Check URL pattern if specified
+            if url_pattern is None or url_pattern in actual_urls[idx - 1]:
+                results.append((True, idx))
+                break
+        else:
+            results.append((False, 0))
+    
+    return results
+
+
+async def evaluate_query(
+    query_data: Dict[str, Any],
+    client: httpx.AsyncClient,
+    limiter: AdaptiveLimiter,
+    log: Callable[[str], None] = print
+) -> Dict[str, Any]:
+    """
+    Evaluate a single query against the API.
+    Output goes through `log`, so concurrent runs can buffer it and print in query order.
+    """
     query_id = query_data["id"]
     query_text = query_data["query"]
     expected_answers = query_data.get("expected_answers", [])
     min_relevant_count = query_data.get("min_relevant_count", 1)
     max_results_to_check = query_data.get("max_results_to_check", 5)
     
-    print(f"\n📝 Query {query_id}: {query_text}")
+    log(f"\n📝 Query {query_id}: {query_text}")
     
-    # Call API - use at least count=1 (API requires count >= 1)
-    # For queries that should return 0 results, we still call with count=5 to see if API returns anything
-    api_count = max(max_results_to_check, 1) if max_results_to_check == 0 else max_results_to_check
-    api_response = call_api(query_text, count=api_count)
+    # Call API - use at least count=1 (API requires count >= 1), precomputed by load_golden_set
+    api_count = query_data.get("_api_count") or max(max_results_to_check, 1)
+    api_response = await call_api(client, limiter, query_text, count=api_count, log=log)
     if api_response is None:
         return {
             "query_id": query_id,
@@ -92,29 +331,35 @@ def evaluate_query(query_data: Dict[str, Any]) -> Dict[str, Any]:
         }
     
     # Get actual answers - combine "answers" (relevant) and "otherRelatedVideos" (not_relevant) into one flat list
-    relevant_answers = api_response.get("answers", []) or []
-    other_related = api_response.get("otherRelatedVideos", []) or []
-    
-    # Ensure both are lists (handle None case)
-    if relevant_answers is None:
-        relevant_answers = []
-    if other_related is None:
-        other_related = []
+    # (missing keys and explicit nulls both fall back to [])
+    relevant_answers = api_response.get("answers") or []
+    other_related = api_response.get("otherRelatedVideos") or []
     
     # Combine into one flat list for evaluation (relevant first, then not_relevant)
     actual_answers = relevant_answers + other_related
     
     search_status = api_response.get("searchStatus", "unknown")
     
-    print(f"  Status: {search_status}")
-    print(f"  Results returned: {len(actual_answers)} (relevant: {len(relevant_answers)}, other: {len(other_related)})")
+    log(f"  Status: {search_status}")
+    log(f"  Results returned: {len(actual_answers)} (relevant: {len(relevant_answers)}, other: {len(other_related)})")
+    
+    # Pull titles / URLs out of the result dicts once into parallel lists, normalizing titles
+    # once (not once per expected answer). The API sends null for missing titles.
+    actual_norm = [normalize_question(r.get("questionTitle") or "") for r in actual_answers]
+    actual_urls = [r.get("videoLink") or "" for r in actual_answers]
     
     # Evaluate each expected answer
     evaluation_results = []
     found_count = 0
     
-    for expected in expected_answers:
-        found, rank = find_answer_in_results(expected, actual_answers)
+    matches = find_answers_in_results(
+        [expected.get("_norm") or normalize_question(expected["question"]) for expected in expected_answers],
+        [expected.get("url_pattern") for expected in expected_answers],
+        actual_norm,
+        actual_urls
+    )
+    
+    for expected, (found, rank) in zip(expected_answers, matches):
         required = expected.get("required", False)
         min_rank = expected.get("min_rank", None)
         
@@ -132,10 +377,10 @@ def evaluate_query(query_data: Dict[str, Any]) -> Dict[str, Any]:
         if found:
             found_count += 1
             status = "✅" if result["rank_ok"] else "⚠️"
-            print(f"  {status} Found: '{expected['question']}' at rank {rank}")
+            log(f"  {status} Found: '{expected['question']}' at rank {rank}")
         else:
             status = "❌" if required else "⚠️"
-            print(f"  {status} Missing: '{expected['question']}'")
+            log(f"  {status} Missing: '{expected['question']}'")
     
     # Calculate metrics
     total_expected = len(expected_answers)
@@ -168,12 +413,64 @@ def evaluate_query(query_data: Dict[str, Any]) -> Dict[str, Any]:
         "search_status": search_status,
         "evaluation_results": evaluation_results,
         "metrics": metrics,
-        "actual_answers": actual_answers[:max_results_to_check]  # Store for review
+        "actual_answers": [  # Store for review
+            {field: answer.get(field) for field in STORED_ANSWER_FIELDS}
+            for answer in actual_answers[:max_results_to_check]
+        ]
     }
 
 
+async def evaluate_all(queries: List[Dict[str, Any]], results_file: Path) -> List[tuple[bool, float, float, float]]:
+    """
+    Evaluate all queries concurrently over one pooled HTTP client, with at most
+    EVAL_CONCURRENCY requests in flight (fewer while the API is throttling).
+    
+    Results are handled in golden-set order as they become available: each query's
+    buffered output is printed and its result is appended to results_file as one
+    NDJSON line, so full results are not kept in memory and an interrupted run
+    keeps everything evaluated so far.
+    
+    Returns (succeeded, precision, recall, required_recall) per query.
+    """
+    limiter = AdaptiveLimiter(limit=min(EVAL_CONCURRENCY, len(queries)), max_limit=EVAL_CONCURRENCY)
+    
+    async def evaluate_buffered(query_data: Dict[str, Any]) -> tuple[Dict[str, Any], List[str]]:
+        lines = []
+        return await evaluate_query(query_data, client, limiter, log=lines.append), lines
+    
+    metric_rows = []
+    # Keep one keep-alive connection per concurrent request so sockets are reused across queries
+    limits = httpx.Limits(max_connections=EVAL_CONCURRENCY, max_keepalive_connections=EVAL_CONCURRENCY)
+    async with httpx.AsyncClient(limits=limits) as client:
+        tasks = [asyncio.create_task(evaluate_buffered(q)) for q in queries]
+        try:
+            with open(results_file, 'ab') as f:
+                for task in tasks:
+                    result, lines = await task
+                    print("\n".join(lines))
+                    f.write(orjson.dumps(result) + b"\n")
+                    f.flush()
+                    
+                    metrics = result["metrics"]
+                    metric_rows.append((
+                        result["status"] == "success",
+                        metrics.get("precision", 0),
+                        metrics.get("recall", 0),
+                        metrics.get("required_recall", 0)
+                    ))
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    return metric_rows
+
+
 def run_evaluation() -> Dict[str, Any]:
-    """Run evaluation on all queries in the golden set."""
+    """
+    Run evaluation on all queries in the golden set.
+    Per-query results are streamed to results/eval_results_<timestamp>.ndjson and the
+    summary is written next to it as eval_results_<timestamp>.json.
+    """
     print("🚀 Starting Evaluation")
     print("=" * 60)
     
@@ -181,36 +478,39 @@ def run_evaluation() -> Dict[str, Any]:
     queries = golden_set.get("queries", [])
     
     print(f"Loaded {len(queries)} test queries from golden set")
-    print(f"API Base URL: {API_BASE_URL}\n")
+    print(f"API Base URL: {API_BASE_URL}")
+    print(f"Concurrency: {EVAL_CONCURRENCY}")
+    if EVAL_CACHE:
+        print(f"⚠️ EVAL_CACHE is on: reusing API responses from {API_CACHE_DIR}")
+    print()
     
     # Create results directory
-    RESULTS_DIR.mkdir(exist_ok=True)
+    _ensure_dir(RESULTS_DIR)
     
-    # Evaluate each query
-    all_results = []
-    for query_data in queries:
-        result = evaluate_query(query_data)
-        all_results.append(result)
+    # Nanosecond epoch timestamp: unique even for back-to-back runs within the same second
+    timestamp = str(time.time_ns())
+    results_file = RESULTS_DIR / f"eval_results_{timestamp}.ndjson"
+    summary_file = RESULTS_DIR / f"eval_results_{timestamp}.json"
     
-    # Calculate overall metrics
-    total_queries = len(all_results)
-    successful_queries = sum(1 for r in all_results if r["status"] == "success")
+    # Evaluate all queries concurrently
+    metric_rows = asyncio.run(evaluate_all(queries, results_file))
     
-    if successful_queries > 0:
-        avg_precision = sum(r["metrics"].get("precision", 0) for r in all_results if r["status"] == "success") / successful_queries
-        avg_recall = sum(r["metrics"].get("recall", 0) for r in all_results if r["status"] == "success") / successful_queries
-        avg_required_recall = sum(r["metrics"].get("required_recall", 0) for r in all_results if r["status"] == "success") / successful_queries
-    else:
-        avg_precision = avg_recall = avg_required_recall = 0
+    # Calculate overall metrics
+    total_queries = len(metric_rows)
+    ok = np.array([row[0] for row in metric_rows], dtype=bool)
+    successful_queries = int(ok.sum())
     
-    # Save results
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    results_file = RESULTS_DIR / f"eval_results_{timestamp}.json"
+    # One (N, 3) array of precision / recall / required_recall, averaged over successful queries
+    metrics_arr = np.array([row[1:] for row in metric_rows], dtype=np.float64).reshape(-1, 3)
+    means = metrics_arr[ok].mean(axis=0) if ok.any() else np.zeros(3)
+    avg_precision, avg_recall, avg_required_recall = means.tolist()
     
+    # Save summary
     evaluation_summary = {
         "timestamp": timestamp,
         "golden_set_version": golden_set.get("version", "unknown"),
         "api_base_url": API_BASE_URL,
+        "results_file": results_file.name,
         "summary": {
             "total_queries": total_queries,
             "successful_queries": successful_queries,
@@ -218,16 +518,15 @@ def run_evaluation() -> Dict[str, Any]:
             "average_precision": round(avg_precision, 3),
             "average_recall": round(avg_recall, 3),
             "average_required_recall": round(avg_required_recall, 3)
-        },
-        "results": all_results
+        }
     }
     
-    with open(results_file, 'w', encoding='utf-8') as f:
-        json.dump(evaluation_summary, f, indent=2, ensure_ascii=False)
+    with open(summary_file, 'wb') as f:
+        f.write(orjson.dumps(evaluation_summary, option=orjson.OPT_INDENT_2))
     
     # Save latest scores
-    with open(SCORES_FILE, 'w', encoding='utf-8') as f:
-        json.dump(evaluation_summary["summary"], f, indent=2)
+    with open(SCORES_FILE, 'wb') as f:
+        f.write(orjson.dumps(evaluation_summary["summary"], option=orjson.OPT_INDENT_2))
     
     # Print summary
     print("\n" + "=" * 60)
@@ -240,6 +539,7 @@ def run_evaluation() -> Dict[str, Any]:
     print(f"Average Recall: {avg_recall:.3f}")
     print(f"Average Required Recall: {avg_required_recall:.3f}")
     print(f"\nResults saved to: {results_file}")
+    print(f"Summary saved to: {summary_file}")
     print(f"Scores saved to: {SCORES_FILE}")
     
     return evaluation_summary